@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import os
 import sys
-from pathlib import Path
-import re
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import xml.etree.ElementTree as ET
 
+XSI_TYPE = "{http://www.w3.org/2001/XMLSchema-instance}type"
+
 def create_set_method_name(attr_name):
     """Create set method name from attribute name"""
     return f"set{snake_to_camel(attr_name).capitalize()}"
@@ -18,84 +20,107 @@ def create_property_name(attr_name):
     """Create property name from attribute name"""
     return f"_{attr_name}"
 
+@functools.lru_cache(maxsize=None)
 def snake_to_camel(snake_str):
     """Convert snake_case to camelCase"""
     components = snake_str.split('_')
     return components[0] + ''.join(word.capitalize() for word in components[1:])
 
-def generate_interface_constants(attributes):
-    """Generate interface constants for attributes"""
-    constants = []
+def expand_attributes(attributes):
+    """Derive (name, type, camelName, MethodSuffix, CONST) once per attribute, shared by all generators"""
+    expanded = []
     for attr_name, attr_type in attributes:
-        constant_name = attr_name.upper()
-        constants.append(f"    public const {constant_name} = '{attr_name}';")
-    return "\n".join(constants)
-
-def generate_interface_methods(attributes):
-    """Generate interface methods for attributes with single blank line separation"""
-    methods = []
-    for i, (attr_name, attr_type) in enumerate(attributes):
         camel_attr_name = snake_to_camel(attr_name)
         method_suffix = camel_attr_name[0].upper() + camel_attr_name[1:]
+        expanded.append((attr_name, attr_type, camel_attr_name, method_suffix, attr_name.upper()))
+    return tuple(expanded)
 
-        # setter
-        methods.append(
-            f"    /**\n"
-            f"     * Setter for {attr_name}\n"
-            f"     *\n"
-            f"     * @param {attr_type} ${camel_attr_name}\n"
-            f"     * @return $this\n"
-            f"     */\n"
-            f"    public function set{method_suffix}({attr_type} ${camel_attr_name}): self;"
-        )
-
-        # getter
-        methods.append(
-            f"\n"
-            f"    /**\n"
-            f"     * Getter for {attr_name}\n"
-            f"     *\n"
-            f"     * @return {attr_type}|null\n"
-            f"     */\n"
-            f"    public function get{method_suffix}(): {attr_type};" + ("\n" if i != len(attributes) - 1 else "")
-        )
-    return "\n".join(methods)
-
-def generate_data_class_methods(attributes):
-    """Generate data class methods for attributes with single blank line separation"""
-    methods = []
-    for i, (attr_name, attr_type) in enumerate(attributes):
-        camel_attr_name = snake_to_camel(attr_name)
-        method_suffix = camel_attr_name[0].upper() + camel_attr_name[1:]
-        const = attr_name.upper()
-
-        # Setter
-        methods.append(
-            f"    /**\n"
-            f"     * Setter for {attr_name}\n"
-            f"     *\n"
-            f"     * @param {attr_type} ${camel_attr_name}\n"
-            f"     * @return $this\n"
-            f"     */\n"
-            f"    public function set{method_suffix}({attr_type} ${camel_attr_name}): self\n    {{\n"
-            f"        return $this->setData(self::{const}, ${camel_attr_name});\n"
-            f"    }}"
-        )
-
-        # Getter
-        methods.append(
-            f"\n"
-            f"    /**\n"
-            f"     * Getter for {attr_name}\n"
-            f"     *\n"
-            f"     * @return {attr_type}|null\n"
-            f"     */\n"
-            f"    public function get{method_suffix}(): {attr_type}\n    {{\n"
-            f"        return $this->getData(self::{const});\n"
-            f"    }}" + ("\n" if i != len(attributes) - 1 else "")
-        )
-
-    return "\n".join(methods)
+@functools.lru_cache(maxsize=128)
+def generate_interface_constants(attributes):
+    """Generate interface constants for expanded attributes"""
+    constants = []
+    for attr_name, attr_type, camel_attr_name, method_suffix, const in attributes:
+        constants.append(f"    public const {const} = '{attr_name}';")
+    return "\n".join(constants)
+
+TEMPLATE_INTERFACE_SETTER = """    /**
+     * Setter for %s
+     *
+     * @param %s $%s
+     * @return $this
+     */
+    public function set%s(%s $%s): self;"""
+
+TEMPLATE_INTERFACE_GETTER = """    /**
+     * Getter for %s
+     *
+     * @return %s|null
+     */
+    public function get%s(): %s;"""
+
+TEMPLATE_DATA_SETTER = """    /**
+     * Setter for %s
+     *
+     * @param %s $%s
+     * @return $this
+     */
+    public function set%s(%s $%s): self
+    {
+        return $this->setData(self::%s, $%s);
+    }"""
+
+TEMPLATE_DATA_GETTER = """    /**
+     * Getter for %s
+     *
+     * @return %s|null
+     */
+    public function get%s(): %s
+    {
+        return $this->getData(self::%s);
+    }"""
+
+@functools.lru_cache(maxsize=128)
+def render_interface_method(attribute):
+    """Render the setter/getter pair of an expanded attribute for the interface"""
+    attr_name, attr_type, camel_attr_name, method_suffix, const = attribute
+    return (
+        TEMPLATE_INTERFACE_SETTER % (attr_name, attr_type, camel_attr_name, method_suffix, attr_type, camel_attr_name)
+        + "\n\n"
+        + TEMPLATE_INTERFACE_GETTER % (attr_name, attr_type, method_suffix, attr_type)
+    )
+
+@functools.lru_cache(maxsize=128)
+def render_data_class_method(attribute):
+    """Render the setter/getter pair of an expanded attribute for the data class"""
+    attr_name, attr_type, camel_attr_name, method_suffix, const = attribute
+    return (
+        TEMPLATE_DATA_SETTER % (attr_name, attr_type, camel_attr_name, method_suffix, attr_type, camel_attr_name, const, camel_attr_name)
+        + "\n\n"
+        + TEMPLATE_DATA_GETTER % (attr_name, attr_type, method_suffix, attr_type, const)
+    )
+
+def iter_interface_methods(attributes):
+    """Yield interface methods for expanded attributes with single blank line separation"""
+    separator = ""
+    for attribute in attributes:
+        yield separator
+        yield render_interface_method(attribute)
+        separator = "\n\n"
+
+def iter_data_class_methods(attributes):
+    """Yield data class methods for expanded attributes with single blank line separation"""
+    separator = ""
+    for attribute in attributes:
+        yield separator
+        yield render_data_class_method(attribute)
+        separator = "\n\n"
+
+def iter_template(template, ctx, placeholder, body):
+    """Yield a file template with the body chunks streamed in place of {placeholder}"""
+    head, _, tail = template.partition(f"{{{placeholder}}}")
+    yield head.format_map(ctx)
+    yield from body
+    yield tail.format_map(ctx)
 
 TEMPLATE_DATA_INTERFACE = """<?php
 declare(strict_types=1);
@@ -134,11 +159,18 @@ class {entity} extends AbstractExtensibleModel implements {entity}Interface
 }}
 """
 
-def write_file(path: Path, content: str):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        f.write(content)
-    print(f"Generated: {path}")
+WRITE_BUFFER_SIZE = 1 << 16
+
+def write_files(files):
+    """Stream (path, chunks) pairs to disk, creating each parent directory once"""
+    for parent in {os.path.dirname(path) for path, _ in files}:
+        os.makedirs(parent, exist_ok=True)
+
+    for path, chunks in files:
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+        print(f"Generated: {path}")
 
 def parse_attributes(attributes_str):
     """Parse attributes string in format: name:type,name2:type2"""
@@ -147,82 +179,97 @@ def parse_attributes(attributes_str):
 
     attributes = []
     for attr in attributes_str.split(','):
-        if ':' in attr:
-            name, attr_type = attr.strip().split(':', 1)
-            attributes.append((name.strip(), attr_type.strip()))
-        else:
-            attributes.append((attr.strip(), 'string'))
+        name, _, attr_type = attr.partition(':')
+        name = name.strip()
+        if name:
+            attributes.append((name, attr_type.strip() or 'string'))
 
     return attributes
 
 def generate_data_object(vendor: str, module: str, entity: str, attributes: list):
-    base_path = Path(f"app/code/{vendor}/{module}")
-    interface_path = base_path / f"Api/Data/{entity}Interface.php"
-    data_path = base_path / f"Model/Data/{entity}.php"
+    base_path = f"app/code/{vendor}/{module}"
+    interface_path = f"{base_path}/Api/Data/{entity}Interface.php"
+    data_path = f"{base_path}/Model/Data/{entity}.php"
 
+    attributes = expand_attributes(attributes)
     interface_constants = generate_interface_constants(attributes)
-    interface_methods = generate_interface_methods(attributes)
-    data_methods = generate_data_class_methods(attributes)
 
     ctx = {
         "vendor": vendor, 
         "module": module, 
         "entity": entity,
-        "interface_constants": interface_constants,
-        "interface_methods": interface_methods,
-        "data_methods": data_methods
+        "interface_constants": interface_constants
     }
 
-    write_file(interface_path, TEMPLATE_DATA_INTERFACE.format(**ctx))
-    write_file(data_path, TEMPLATE_DATA_CLASS.format(**ctx))
+    write_files([
+        (interface_path, iter_template(TEMPLATE_DATA_INTERFACE, ctx, "interface_methods", iter_interface_methods(attributes))),
+        (data_path, iter_template(TEMPLATE_DATA_CLASS, ctx, "data_methods", iter_data_class_methods(attributes))),
+    ])
 
-def parse_magento_schema(schema_path):
-    tree = ET.parse(schema_path)
-    root = tree.getroot()
-
-    # Define xsi namespace mapping
-    ns = {'xsi': 'http://www.w3.org/2001/XMLSchema-instance'}
+def parse_magento_schema(schema_path, target_table=None):
+    """Parse db_schema.xml incrementally; with target_table, stop as soon as that table is found"""
+    context = ET.iterparse(schema_path, events=("start", "end"))
+    _, root = next(context)
 
     tables = []
 
-    for table in root.findall("table"):
+    for event, table in context:
+        if event != "end" or table.tag != "table" or table not in root:
+            continue
+
         table_name = table.get("name")
+        if target_table is not None and table_name != target_table:
+            root.remove(table)
+            continue
+
         columns = []
 
-        for column in table.findall("column"):
+        for column in table.iterfind("column"):
             column_name = column.get("name")
             # Get the xsi:type attribute using namespace
-            column_type = column.attrib.get('{http://www.w3.org/2001/XMLSchema-instance}type')
+            column_type = column.get(XSI_TYPE)
 
-            columns.append({
-                "name": column_name,
-                "type": column_type
-            })
+            columns.append((column_name, column_type))
 
         tables.append({
             "table": table_name,
             "columns": columns
         })
 
+        if target_table is not None:
+            break
+
+        root.remove(table)
+
     return tables
 
+DB_TO_PHP_TYPES = {
+    "int": "int",
+    "smallint": "int",
+    "bigint": "int",
+    "decimal": "float",
+    "float": "float",
+    "double": "float",
+    "boolean": "bool",
+    "varchar": "string",
+    "text": "string",
+    "timestamp": "\\DateTimeInterface",
+    "datetime": "\\DateTimeInterface",
+    "date": "\\DateTimeInterface"
+}
+
 def map_db_type_to_php_type(db_type):
     """Map Magento DB types to PHP types"""
-    mapping = {
-        "int": "int",
-        "smallint": "int",
-        "bigint": "int",
-        "decimal": "float",
-        "float": "float",
-        "double": "float",
-        "boolean": "bool",
-        "varchar": "string",
-        "text": "string",
-        "timestamp": "\\DateTimeInterface",
-        "datetime": "\\DateTimeInterface",
-        "date": "\\DateTimeInterface"
-    }
-    return mapping.get(db_type.lower(), "string")
+    php_type = DB_TO_PHP_TYPES.get(db_type)
+    return php_type if php_type is not None else DB_TO_PHP_TYPES.get(db_type.lower(), "string")
+
+def table_to_attributes(table):
+    """Build (name, php_type) attribute pairs from a parsed table"""
+    return [(name, map_db_type_to_php_type(db_type)) for name, db_type in table["columns"]]
+
+def generate_data_object_job(job):
+    """Run generate_data_object for a (vendor, module, entity, attributes) job in a worker process"""
+    generate_data_object(*job)
 
 def convert_table_to_entity(table_name):
     """Convert table name (e.g. bss_custom_entity) to PascalCase entity name (e.g. CustomEntity)"""
@@ -236,6 +283,9 @@ def main():
     parser.add_argument('-m', '--module', required=True, help='Module name', metavar='')
     parser.add_argument('-e', '--entity', required=False, help='Entity name, if there no entity name, it will be generated from table name', metavar='')
     parser.add_argument('-db', '--db_schema', required=True, help='Path to db_schema.xml file', metavar='')
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument('-t', '--table', required=False, help='Table name, skips the table selection and stops parsing once the table is found', metavar='')
+    selection.add_argument('-a', '--all', action='store_true', help='Generate data objects for every table in the schema, in parallel')
 
     args = parser.parse_args()
 
@@ -243,15 +293,43 @@ def main():
     module = args.module.strip()
     db_schema_path = args.db_schema.strip()
 
+    if args.all and args.entity:
+        print("Error: --entity cannot be combined with --all, entity names are generated from table names")
+        sys.exit(1)
+
     if not os.path.exists(db_schema_path):
         print(f"Error: File not found: {db_schema_path}")
         sys.exit(1)
 
-    tables = parse_magento_schema(db_schema_path)
+    target_table = args.table.strip() if args.table else None
+    tables = parse_magento_schema(db_schema_path, target_table)
     if not tables:
-        print("No tables found in schema.")
+        if target_table:
+            print(f"Table not found in schema: {target_table}")
+        else:
+            print("No tables found in schema.")
         sys.exit(1)
 
+    if args.all:
+        entity_tables = {}
+        for t in tables:
+            entity_tables.setdefault(convert_table_to_entity(t["table"]), []).append(t["table"])
+
+        clashes = {name: names for name, names in entity_tables.items() if len(names) > 1}
+        if clashes:
+            print("Error: these tables map to the same entity name, generate them one by one with -t and -e:")
+            for name, names in clashes.items():
+                print(f"  {name}: {', '.join(names)}")
+            sys.exit(1)
+
+        jobs = [
+            (vendor, module, convert_table_to_entity(t["table"]), table_to_attributes(t))
+            for t in tables
+        ]
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(generate_data_object_job, jobs))
+        return
+
     print("Available tables:")
     for i, t in enumerate(tables):
         print(f"  [{i + 1}] {t['table']}")
@@ -270,12 +348,7 @@ def main():
     else:
         entity = args.entity
 
-    attributes = [
-        (col["name"], map_db_type_to_php_type(col["type"]))
-        for col in table["columns"]
-    ]
-
-    generate_data_object(vendor, module, entity, attributes)
+    generate_data_object(vendor, module, entity, table_to_attributes(table))
 
 if __name__ == "__main__":
     main()